@@ -1014,9 +1014,12 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
     ) -> hikari.Command:
         # <<inherited docstring from tanjun.abc.Client>>.
         builder = command.build()
+        if not application:
+            application = self._cached_application_id or await self.fetch_rest_application_id()
+
         if command_id:
             response = await self._rest.edit_application_command(
-                application or self._cached_application_id or await self.fetch_rest_application_id(),
+                application,
                 command_id,
                 guild=guild,
                 name=builder.name,
@@ -1026,7 +1029,7 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
 
         else:
             response = await self._rest.create_application_command(
-                application or self._cached_application_id or await self.fetch_rest_application_id(),
+                application,
                 guild=guild,
                 name=builder.name,
                 description=builder.description,
@@ -300,7 +300,7 @@ class CallbackDescriptor(AbstractDescriptor[_T]):
     This holds metadata and logic necessary for callback injection.
     """
 
-    __slots__ = ("_callback", "_descriptors", "_is_async", "_needs_injector")
+    __slots__ = ("_callback", "_descriptors", "_has_callback_dependencies", "_is_async", "_needs_injector")
 
     def __init__(self, callback: CallbackSig[_T], /) -> None:
         """Initialise an injected callback descriptor.
@@ -319,6 +319,7 @@ class CallbackDescriptor(AbstractDescriptor[_T]):
         self._callback = callback
         self._is_async: typing.Optional[bool] = None
         self._descriptors, self._needs_injector = self._parse_descriptors(callback)
+        self._has_callback_dependencies = any(isinstance(d, CallbackDescriptor) for d in self._descriptors.values())
 
     # This is delegated to the callback to delegate set/list behaviour for this class to the callback.
     def __eq__(self, other: typing.Any) -> bool:
@@ -333,6 +334,22 @@ class CallbackDescriptor(AbstractDescriptor[_T]):
         """The descriptor's callback."""
         return self._callback
 
+    @property
+    def has_callback_dependencies(self) -> bool:
+        """Whether the descriptor's callback has any injected callback dependencies.
+
+        These are resolved before the callback is called and may be asynchronous.
+        """
+        return self._has_callback_dependencies
+
+    @property
+    def is_async(self) -> typing.Optional[bool]:
+        """Whether the descriptor's callback is asynchronous.
+
+        This will be `None` until the callback has been called at least once.
+        """
+        return self._is_async
+
     @property
     def needs_injector(self) -> bool:
         # <<inherited docstring from Descriptor>>.
@@ -394,6 +411,7 @@ class CallbackDescriptor(AbstractDescriptor[_T]):
         self._callback = callback
         self._is_async = None
         self._descriptors, self._needs_injector = self._parse_descriptors(callback)
+        self._has_callback_dependencies = any(isinstance(d, CallbackDescriptor) for d in self._descriptors.values())
 
     def resolve_with_command_context(
         self, ctx: tanjun_abc.Context, /, *args: typing.Any, **kwargs: typing.Any
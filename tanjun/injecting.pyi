@@ -114,6 +114,10 @@ class CallbackDescriptor(AbstractDescriptor[_T]):
     @property
     def callback(self) -> CallbackSig[_T]: ...
     @property
+    def has_callback_dependencies(self) -> bool: ...
+    @property
+    def is_async(self) -> typing.Optional[bool]: ...
+    @property
     def needs_injector(self) -> bool: ...
     def copy(self: _CallbackDescriptorT, *, _new: bool = ...) -> _CallbackDescriptorT: ...
     def overwrite_callback(self, callback: CallbackSig[_T], /) -> None: ...
@@ -45,6 +45,7 @@ __all__: list[str] = [
 ]
 
 import asyncio
+import operator
 import typing
 from collections import abc as collections
 
@@ -67,6 +68,8 @@ _OtherValueT = typing.TypeVar("_OtherValueT")
 async def gather_checks(ctx: abc.Context, checks_: collections.Iterable[checks.InjectableCheck], /) -> bool:
     """Gather a collection of checks.
 
+    Every check is run, even if an earlier check failed.
+
     Parameters
     ----------
     ctx : tanjun.abc.Context
@@ -79,8 +82,30 @@ async def gather_checks(ctx: abc.Context, checks_: collections.Iterable[checks.I
     bool
         Whether all the checks passed or not.
     """
+    to_check = tuple(checks_)
+    # Checks which are known to be synchronous and don't have any injected
+    # callbacks (which may be asynchronous) to resolve won't be waiting on IO,
+    # so these are run in order to avoid creating a task per check.
+    if all(check.is_async is False and not check.has_callback_dependencies for check in to_check):
+        error: typing.Optional[Exception] = None
+        for check in to_check:
+            try:
+                await check(ctx)
+
+            except Exception as exc:
+                # This mirrors asyncio.gather by relaying the first error.
+                error = error or exc
+
+        if isinstance(error, errors.FailedCheck):
+            return False
+
+        if error:
+            raise error
+
+        return True
+
     try:
-        await asyncio.gather(*(check(ctx) for check in checks_))
+        await asyncio.gather(*(check(ctx) for check in to_check))
         # InjectableCheck will raise FailedCheck if a false is received so if
         # we get this far then it's True.
         return True
@@ -129,41 +154,72 @@ DM_PERMISSIONS: typing.Final[hikari.Permissions] = (
 )
 """Bitfield of the permissions which are accessibly within DM channels."""
 
+_ADMINISTRATOR: typing.Final[int] = hikari.Permissions.ADMINISTRATOR.value
+
 
 def _calculate_channel_overwrites(
     channel: hikari.GuildChannel, member: hikari.Member, permissions: hikari.Permissions
 ) -> hikari.Permissions:
-    if everyone_overwrite := channel.permission_overwrites.get(member.guild_id):
-        permissions &= ~everyone_overwrite.deny
-        permissions |= everyone_overwrite.allow
+    overwrites = channel.permission_overwrites
+    if not overwrites:
+        return permissions
 
-    deny = hikari.Permissions.NONE
-    allow = hikari.Permissions.NONE
+    # This works with the raw int values to avoid creating a new Permissions
+    # object for every operation.
+    value = permissions.value
+    # The @everyone overwrite can't be folded into the role overwrites as a
+    # role's deny has to take precedence over an @everyone allow.
+    get_overwrite = overwrites.get
+    if everyone_overwrite := get_overwrite(member.guild_id):
+        value = (value & ~everyone_overwrite.deny.value) | everyone_overwrite.allow.value
 
-    for overwrite in filter(None, map(channel.permission_overwrites.get, member.role_ids)):
-        deny |= overwrite.deny
-        allow |= overwrite.allow
+    deny = allow = 0
+    for role_id in member.role_ids:
+        if overwrite := get_overwrite(role_id):
+            deny |= overwrite.deny.value
+            allow |= overwrite.allow.value
 
-    permissions &= ~deny
-    permissions |= allow
+    value = (value & ~deny) | allow
 
-    if member_overwrite := channel.permission_overwrites.get(member.user.id):
-        permissions &= ~member_overwrite.deny
-        permissions |= member_overwrite.allow
+    if member_overwrite := get_overwrite(member.user.id):
+        value = (value & ~member_overwrite.deny.value) | member_overwrite.allow.value
 
-    return permissions
+    return hikari.Permissions(value)
 
 
 def _calculate_role_permissions(
     roles: collections.Mapping[hikari.Snowflake, hikari.Role], member: hikari.Member
 ) -> hikari.Permissions:
-    permissions = roles[member.guild_id].permissions
+    everyone_permissions = roles[member.guild_id].permissions
+    role_ids = member.role_ids
+    # Admin permission overrides everything else so there's no need to look
+    # at any more roles once it's been found.
+    if not role_ids or everyone_permissions.value & _ADMINISTRATOR:
+        return everyone_permissions
+
+    # This works with the raw int values to avoid creating a new Permissions
+    # object for every role.
+    value = everyone_permissions.value
+    member_roles: collections.Iterable[hikari.Role]
+    try:
+        # Batch the lookups into a single call when every role is present.
+        if len(role_ids) > 1:
+            member_roles = operator.itemgetter(*role_ids)(roles)
 
-    for role in map(roles.get, member.role_ids):
-        if role and role.id != member.guild_id:
-            permissions |= role.permissions
+        else:
+            member_roles = tuple(map(roles.__getitem__, role_ids))
 
-    return permissions
+    except KeyError:
+        member_roles = [role for role in map(roles.get, role_ids) if role]
+
+    # The @everyone role doesn't need to be skipped here as OR-ing its
+    # permissions in again is a no-op.
+    for role in member_roles:
+        value |= role.permissions.value
+        if value & _ADMINISTRATOR:
+            break
+
+    return hikari.Permissions(value)
 
 
 # TODO: implicitly handle more special cases?
@@ -208,7 +264,7 @@ def calculate_permissions(
         return ALL_PERMISSIONS
 
     # Admin permission overrides all overwrites and is only applicable to roles.
-    if (permissions := _calculate_role_permissions(roles, member)) & permissions.ADMINISTRATOR:
+    if (permissions := _calculate_role_permissions(roles, member)).value & _ADMINISTRATOR:
         return ALL_PERMISSIONS
 
     if not channel:
@@ -318,7 +374,7 @@ async def fetch_permissions(
         roles = {role.id: role for role in raw_roles}
 
     # Admin permission overrides all overwrites and is only applicable to roles.
-    if (permissions := _calculate_role_permissions(roles, member)) & permissions.ADMINISTRATOR:
+    if (permissions := _calculate_role_permissions(roles, member)).value & _ADMINISTRATOR:
         return ALL_PERMISSIONS
 
     if not channel:
@@ -361,7 +417,7 @@ def calculate_everyone_permissions(
     # For more information see https://discord.com/developers/docs/topics/permissions#permission-hierarchy.
     permissions = everyone_role.permissions
     # Admin permission overrides all overwrites and is only applicable to roles.
-    if permissions & permissions.ADMINISTRATOR:
+    if permissions.value & _ADMINISTRATOR:
         return ALL_PERMISSIONS
 
     if not channel:
@@ -433,7 +489,7 @@ async def fetch_everyone_permissions(
 
     permissions = role.permissions
     # Admin permission overrides all overwrites and is only applicable to roles.
-    if permissions & permissions.ADMINISTRATOR:
+    if permissions.value & _ADMINISTRATOR:
         return ALL_PERMISSIONS
 
     if not channel:
@@ -157,6 +157,37 @@ class TestCallbackDescriptor:
 
         assert tanjun.injecting.CallbackDescriptor(mock_callback).callback is mock_callback
 
+    def test_has_callback_dependencies_property(self):
+        def foo(bar: int = tanjun.inject(type=int), baz: str = tanjun.inject(callback=mock.Mock())) -> None:
+            ...
+
+        assert tanjun.injecting.CallbackDescriptor(foo).has_callback_dependencies is True
+
+    def test_has_callback_dependencies_property_when_only_type_dependencies(self):
+        def foo(bar: int = tanjun.inject(type=int), baz: int = 42) -> None:
+            ...
+
+        assert tanjun.injecting.CallbackDescriptor(foo).has_callback_dependencies is False
+
+    def test_is_async_property_when_not_called(self):
+        assert tanjun.injecting.CallbackDescriptor(mock.Mock()).is_async is None
+
+    @pytest.mark.asyncio()
+    async def test_is_async_property_when_sync(self):
+        descriptor = tanjun.injecting.CallbackDescriptor(mock.Mock())
+
+        await descriptor.resolve_without_injector()
+
+        assert descriptor.is_async is False
+
+    @pytest.mark.asyncio()
+    async def test_is_async_property_when_async(self):
+        descriptor = tanjun.injecting.CallbackDescriptor(mock.AsyncMock())
+
+        await descriptor.resolve_without_injector()
+
+        assert descriptor.is_async is True
+
     def test_needs_injector_property_when_no_defaulting_type_injector(self):
         mock_type: typing.Any = mock.Mock()
 
@@ -33,10 +33,12 @@
 # pyright: reportPrivateUsage=none
 # This leads to too many false-positives around mocks.
 
+import asyncio
 import typing
 from collections import abc as collections
 from unittest import mock
 
+import hikari
 import pytest
 
 import tanjun
@@ -82,6 +84,102 @@ async def test_gather_checks():
     check_3.assert_awaited_once_with(mock_ctx)
 
 
+@pytest.mark.asyncio()
+async def test_gather_checks_when_all_sync():
+    mock_ctx = mock.Mock()
+    check_1 = mock.AsyncMock(is_async=False, has_callback_dependencies=False)
+    check_2 = mock.AsyncMock(is_async=False, has_callback_dependencies=False)
+    check_3 = mock.AsyncMock(is_async=False, has_callback_dependencies=False)
+
+    with mock.patch.object(asyncio, "gather") as gather:
+        assert await utilities.gather_checks(mock_ctx, (check_1, check_2, check_3)) is True
+
+    gather.assert_not_called()
+    check_1.assert_awaited_once_with(mock_ctx)
+    check_2.assert_awaited_once_with(mock_ctx)
+    check_3.assert_awaited_once_with(mock_ctx)
+
+
+@pytest.mark.asyncio()
+async def test_gather_checks_when_all_sync_handles_failed_check():
+    mock_ctx = mock.Mock()
+    check_1 = mock.AsyncMock(is_async=False, has_callback_dependencies=False)
+    check_2 = mock.AsyncMock(is_async=False, has_callback_dependencies=False, side_effect=tanjun.FailedCheck)
+    check_3 = mock.AsyncMock(is_async=False, has_callback_dependencies=False)
+
+    assert await utilities.gather_checks(mock_ctx, (check_1, check_2, check_3)) is False
+
+    check_1.assert_awaited_once_with(mock_ctx)
+    check_2.assert_awaited_once_with(mock_ctx)
+    check_3.assert_awaited_once_with(mock_ctx)
+
+
+@pytest.mark.asyncio()
+async def test_gather_checks_when_all_sync_relays_first_error():
+    mock_ctx = mock.Mock()
+    mock_exception = Exception("test")
+    check_1 = mock.AsyncMock(is_async=False, has_callback_dependencies=False)
+    check_2 = mock.AsyncMock(is_async=False, has_callback_dependencies=False, side_effect=mock_exception)
+    check_3 = mock.AsyncMock(is_async=False, has_callback_dependencies=False, side_effect=tanjun.FailedCheck)
+
+    with pytest.raises(Exception, match="test") as exc:
+        await utilities.gather_checks(mock_ctx, (check_1, check_2, check_3))
+
+    assert exc.value is mock_exception
+    check_1.assert_awaited_once_with(mock_ctx)
+    check_2.assert_awaited_once_with(mock_ctx)
+    check_3.assert_awaited_once_with(mock_ctx)
+
+
+@pytest.mark.asyncio()
+async def test_gather_checks_when_sync_check_has_callback_dependencies():
+    mock_ctx = mock.Mock()
+    check_1 = mock.AsyncMock(is_async=False, has_callback_dependencies=False)
+    check_2 = mock.AsyncMock(is_async=False, has_callback_dependencies=True)
+
+    with mock.patch.object(asyncio, "gather", wraps=asyncio.gather) as gather:
+        assert await utilities.gather_checks(mock_ctx, (check_1, check_2)) is True
+
+    gather.assert_called_once()
+    check_1.assert_awaited_once_with(mock_ctx)
+    check_2.assert_awaited_once_with(mock_ctx)
+
+
+@pytest.mark.asyncio()
+async def test_gather_checks_when_sync_check_has_async_dependency():
+    mock_dependency = mock.AsyncMock(return_value=True)
+
+    def check(ctx: tanjun.abc.Context, value: bool = tanjun.inject(callback=mock_dependency)) -> bool:
+        return value
+
+    injectable_check = tanjun.checks.InjectableCheck(check)
+    mock_ctx = mock.Mock(tanjun.abc.Context)
+    await injectable_check(mock_ctx)
+    assert injectable_check.is_async is False
+
+    with mock.patch.object(asyncio, "gather", wraps=asyncio.gather) as gather:
+        assert await utilities.gather_checks(mock_ctx, (injectable_check, injectable_check)) is True
+
+    gather.assert_called_once()
+    assert mock_dependency.await_count == 3
+
+
+@pytest.mark.asyncio()
+async def test_gather_checks_when_some_not_known_to_be_sync():
+    mock_ctx = mock.Mock()
+    check_1 = mock.AsyncMock(is_async=False)
+    check_2 = mock.AsyncMock(is_async=None)
+    check_3 = mock.AsyncMock(is_async=True)
+
+    with mock.patch.object(asyncio, "gather", wraps=asyncio.gather) as gather:
+        assert await utilities.gather_checks(mock_ctx, (check_1, check_2, check_3)) is True
+
+    gather.assert_called_once()
+    check_1.assert_awaited_once_with(mock_ctx)
+    check_2.assert_awaited_once_with(mock_ctx)
+    check_3.assert_awaited_once_with(mock_ctx)
+
+
 @pytest.mark.skip(reason="Not implemented")
 @pytest.mark.asyncio()
 async def test_fetch_resource():
@@ -103,9 +201,103 @@ def test_match_prefix_names(content: str, prefix: str, expected_result: typing.O
     assert utilities.match_prefix_names(content, prefix) == expected_result
 
 
-@pytest.mark.skip(reason="Not implemented")
-def test_calculate_permissions():
-    ...
+_EVERYONE_ID = 123
+_MEMBER_ID = 6534123
+
+
+def _make_role(role_id: int, permissions: typing.Any) -> mock.Mock:
+    return mock.Mock(hikari.Role, id=hikari.Snowflake(role_id), permissions=permissions)
+
+
+def _make_member(guild_id: int, role_ids: collections.Sequence[int]) -> mock.Mock:
+    return mock.Mock(
+        hikari.Member,
+        guild_id=hikari.Snowflake(guild_id),
+        role_ids=[hikari.Snowflake(role_id) for role_id in role_ids],
+        user=mock.Mock(id=hikari.Snowflake(_MEMBER_ID)),
+    )
+
+
+@pytest.mark.parametrize(
+    ("overwrites", "expected_permissions"),
+    [
+        # @everyone overwrite on its own
+        (
+            {_EVERYONE_ID: (hikari.Permissions.EMBED_LINKS, hikari.Permissions.SEND_MESSAGES)},
+            hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.EMBED_LINKS,
+        ),
+        # A role's deny overrides an @everyone allow
+        (
+            {
+                _EVERYONE_ID: (hikari.Permissions.EMBED_LINKS, hikari.Permissions.NONE),
+                321: (hikari.Permissions.NONE, hikari.Permissions.EMBED_LINKS),
+            },
+            hikari.Permissions.SEND_MESSAGES | hikari.Permissions.VIEW_CHANNEL,
+        ),
+        # The deny and allow masks of several role overwrites are combined
+        (
+            {
+                321: (hikari.Permissions.EMBED_LINKS, hikari.Permissions.SEND_MESSAGES),
+                654: (hikari.Permissions.ATTACH_FILES, hikari.Permissions.VIEW_CHANNEL),
+            },
+            hikari.Permissions.EMBED_LINKS | hikari.Permissions.ATTACH_FILES,
+        ),
+        # One role's allow overrides another role's deny
+        (
+            {
+                321: (hikari.Permissions.NONE, hikari.Permissions.EMBED_LINKS | hikari.Permissions.SEND_MESSAGES),
+                654: (hikari.Permissions.EMBED_LINKS, hikari.Permissions.NONE),
+            },
+            hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.EMBED_LINKS,
+        ),
+        # A member overwrite overrides role overwrites
+        (
+            {
+                321: (hikari.Permissions.EMBED_LINKS, hikari.Permissions.ATTACH_FILES),
+                _MEMBER_ID: (hikari.Permissions.ATTACH_FILES, hikari.Permissions.EMBED_LINKS),
+            },
+            hikari.Permissions.SEND_MESSAGES | hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.ATTACH_FILES,
+        ),
+        # No overwrites apply to the member's roles
+        (
+            {999: (hikari.Permissions.EMBED_LINKS, hikari.Permissions.SEND_MESSAGES)},
+            hikari.Permissions.SEND_MESSAGES | hikari.Permissions.VIEW_CHANNEL,
+        ),
+    ],
+)
+def test_calculate_permissions(
+    overwrites: dict[int, tuple[hikari.Permissions, hikari.Permissions]], expected_permissions: hikari.Permissions
+):
+    mock_guild = mock.Mock(hikari.Guild, id=hikari.Snowflake(_EVERYONE_ID), owner_id=hikari.Snowflake(5412))
+    roles = {
+        hikari.Snowflake(_EVERYONE_ID): _make_role(
+            _EVERYONE_ID, hikari.Permissions.SEND_MESSAGES | hikari.Permissions.VIEW_CHANNEL
+        ),
+        hikari.Snowflake(321): _make_role(321, hikari.Permissions.NONE),
+        hikari.Snowflake(654): _make_role(654, hikari.Permissions.NONE),
+    }
+    mock_channel = mock.Mock(
+        hikari.GuildChannel,
+        permission_overwrites={
+            hikari.Snowflake(target_id): mock.Mock(hikari.PermissionOverwrite, allow=allow, deny=deny)
+            for target_id, (allow, deny) in overwrites.items()
+        },
+    )
+
+    result = utilities.calculate_permissions(
+        _make_member(_EVERYONE_ID, [321, 654]), mock_guild, roles, channel=mock_channel
+    )
+
+    assert result == expected_permissions
+
+
+def test__calculate_channel_overwrites_when_no_overwrites():
+    mock_permissions = mock.Mock()
+    mock_channel = mock.Mock(hikari.GuildChannel, permission_overwrites={})
+
+    result = utilities._calculate_channel_overwrites(mock_channel, _make_member(_EVERYONE_ID, [321]), mock_permissions)
+
+    assert result is mock_permissions
 
 
 @pytest.mark.skip(reason="Not implemented")
@@ -113,14 +305,110 @@ def test_calculate_permissions_when_guild_owner():
     ...
 
 
-@pytest.mark.skip(reason="Not implemented")
 def test_calculate_permissions_when_admin_role():
-    ...
+    unread_role = mock.Mock(hikari.Role, id=hikari.Snowflake(431))
+    unread_permissions = mock.PropertyMock()
+    type(unread_role).permissions = unread_permissions
+    mock_guild = mock.Mock(hikari.Guild, id=hikari.Snowflake(123), owner_id=hikari.Snowflake(5412))
+    roles = {
+        hikari.Snowflake(123): _make_role(123, hikari.Permissions.SEND_MESSAGES),
+        hikari.Snowflake(321): _make_role(321, hikari.Permissions.VIEW_CHANNEL),
+        hikari.Snowflake(654): _make_role(654, hikari.Permissions.ADMINISTRATOR),
+        hikari.Snowflake(431): unread_role,
+    }
+    member = _make_member(123, [321, 654, 431])
 
+    result = utilities.calculate_permissions(member, mock_guild, roles, channel=mock.Mock(hikari.GuildChannel))
 
-@pytest.mark.skip(reason="Not implemented")
-def test_calculate_permissions_when_no_channel():
-    ...
+    assert result is utilities.ALL_PERMISSIONS
+    unread_permissions.assert_not_called()
+
+
+def test_calculate_permissions_when_everyone_role_is_admin():
+    unread_role = mock.Mock(hikari.Role, id=hikari.Snowflake(321))
+    unread_permissions = mock.PropertyMock()
+    type(unread_role).permissions = unread_permissions
+    mock_guild = mock.Mock(hikari.Guild, id=hikari.Snowflake(123), owner_id=hikari.Snowflake(5412))
+    roles = {
+        hikari.Snowflake(123): _make_role(123, hikari.Permissions.ADMINISTRATOR),
+        hikari.Snowflake(321): unread_role,
+    }
+    member = _make_member(123, [321])
+
+    result = utilities.calculate_permissions(member, mock_guild, roles, channel=mock.Mock(hikari.GuildChannel))
+
+    assert result is utilities.ALL_PERMISSIONS
+    unread_permissions.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("role_ids", "expected_permissions"),
+    [
+        ([], hikari.Permissions.SEND_MESSAGES),
+        ([321], hikari.Permissions.SEND_MESSAGES | hikari.Permissions.VIEW_CHANNEL),
+        (
+            [321, 654],
+            hikari.Permissions.SEND_MESSAGES | hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.EMBED_LINKS,
+        ),
+        ([123, 321], hikari.Permissions.SEND_MESSAGES | hikari.Permissions.VIEW_CHANNEL),
+    ],
+)
+def test_calculate_permissions_when_no_channel(role_ids: list[int], expected_permissions: hikari.Permissions):
+    mock_guild = mock.Mock(hikari.Guild, id=hikari.Snowflake(123), owner_id=hikari.Snowflake(5412))
+    roles = {
+        hikari.Snowflake(123): _make_role(123, hikari.Permissions.SEND_MESSAGES),
+        hikari.Snowflake(321): _make_role(321, hikari.Permissions.VIEW_CHANNEL),
+        hikari.Snowflake(654): _make_role(654, hikari.Permissions.EMBED_LINKS),
+    }
+
+    result = utilities.calculate_permissions(_make_member(123, role_ids), mock_guild, roles)
+
+    assert result == expected_permissions
+
+
+def test__calculate_role_permissions_when_no_roles():
+    mock_permissions = mock.Mock(value=int(hikari.Permissions.SEND_MESSAGES))
+    roles = {hikari.Snowflake(123): _make_role(123, mock_permissions)}
+
+    result = utilities._calculate_role_permissions(roles, _make_member(123, []))
+
+    assert result is mock_permissions
+
+
+def test__calculate_role_permissions_when_everyone_role_is_admin():
+    mock_permissions = mock.Mock(value=int(hikari.Permissions.ADMINISTRATOR))
+    roles = {
+        hikari.Snowflake(123): _make_role(123, mock_permissions),
+        hikari.Snowflake(321): _make_role(321, hikari.Permissions.VIEW_CHANNEL),
+    }
+
+    result = utilities._calculate_role_permissions(roles, _make_member(123, [321]))
+
+    assert result is mock_permissions
+
+
+@pytest.mark.parametrize(
+    ("role_ids", "expected_permissions"),
+    [
+        ([999], hikari.Permissions.SEND_MESSAGES),
+        ([999, 998], hikari.Permissions.SEND_MESSAGES),
+        (
+            [321, 999, 654],
+            hikari.Permissions.SEND_MESSAGES | hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.EMBED_LINKS,
+        ),
+    ],
+)
+def test_calculate_permissions_when_role_not_found(role_ids: list[int], expected_permissions: hikari.Permissions):
+    mock_guild = mock.Mock(hikari.Guild, id=hikari.Snowflake(123), owner_id=hikari.Snowflake(5412))
+    roles = {
+        hikari.Snowflake(123): _make_role(123, hikari.Permissions.SEND_MESSAGES),
+        hikari.Snowflake(321): _make_role(321, hikari.Permissions.VIEW_CHANNEL),
+        hikari.Snowflake(654): _make_role(654, hikari.Permissions.EMBED_LINKS),
+    }
+
+    result = utilities.calculate_permissions(_make_member(123, role_ids), mock_guild, roles)
+
+    assert result == expected_permissions
 
 
 @pytest.mark.skip(reason="Not implemented")